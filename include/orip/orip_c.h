@@ -77,6 +77,12 @@ typedef enum {
     ORIP_STATUS_REMOTE_ID_FAILURE = 4
 } orip_uav_status_t;
 
+typedef enum {
+    ORIP_EVENT_NEW_UAV = 0,
+    ORIP_EVENT_UAV_UPDATE = 1,
+    ORIP_EVENT_UAV_TIMEOUT = 2
+} orip_event_type_t;
+
 /* ============================================================================
  * Data structures (C-compatible, fixed-size)
  * ============================================================================ */
@@ -156,6 +162,11 @@ typedef struct {
     int enable_cn;
 } orip_config_t;
 
+typedef struct {
+    orip_event_type_t type;
+    orip_uav_t uav;
+} orip_event_t;
+
 /* ============================================================================
  * Callback types
  * ============================================================================ */
@@ -212,6 +223,25 @@ int orip_parse(orip_parser_t* parser,
                orip_transport_t transport,
                orip_result_t* result);
 
+/**
+ * Parse a batch of raw Bluetooth/WiFi payloads in a single call
+ * @param parser Parser handle
+ * @param payloads Array of pointers to raw data bytes
+ * @param payload_lens Array of payload lengths
+ * @param rssis Array of signal strengths (dBm)
+ * @param transports Array of transport types
+ * @param count Number of payloads in the batch
+ * @param results Output array of result structures (caller allocated, count entries)
+ * @return 0 on success, non-zero if any payload hit an internal error
+ */
+int orip_parse_batch(orip_parser_t* parser,
+                     const uint8_t* const* payloads,
+                     const size_t* payload_lens,
+                     const int8_t* rssis,
+                     const orip_transport_t* transports,
+                     size_t count,
+                     orip_result_t* results);
+
 /**
  * Get count of active UAVs
  * @param parser Parser handle
@@ -241,6 +271,23 @@ int orip_get_uav(const orip_parser_t* parser,
                  const char* id,
                  orip_uav_t* uav);
 
+/**
+ * Refresh a tracked UAV seen again with an unchanged payload
+ *
+ * Updates RSSI and last-seen time and increments the message count,
+ * without decoding anything. Invokes the update callback and queues an
+ * update event, like a parse of the same payload would.
+ * @param parser Parser handle
+ * @param id UAV ID string
+ * @param rssi Signal strength (dBm)
+ * @param uav Optional output for the refreshed UAV (may be NULL)
+ * @return 0 if the UAV was updated, non-zero if not found
+ */
+int orip_touch(orip_parser_t* parser,
+               const char* id,
+               int8_t rssi,
+               orip_uav_t* uav);
+
 /**
  * Clear all tracked UAVs
  * @param parser Parser handle
@@ -284,6 +331,38 @@ void orip_set_on_uav_timeout(orip_parser_t* parser,
                              orip_uav_callback_t callback,
                              void* user_data);
 
+/**
+ * Enable or disable the event queue
+ *
+ * While enabled, new/update/timeout events are queued for
+ * orip_drain_events() in addition to any registered callbacks.
+ * Disabling discards queued events. The queue is unbounded, so drain
+ * it regularly.
+ * @param parser Parser handle
+ * @param enabled Non-zero to enable, zero to disable
+ */
+void orip_set_event_queue(orip_parser_t* parser, int enabled);
+
+/**
+ * Get count of queued events
+ * @param parser Parser handle
+ * @return Number of events waiting to be drained
+ */
+size_t orip_pending_events(const orip_parser_t* parser);
+
+/**
+ * Move queued events into a caller-provided array, oldest first
+ *
+ * May be called from another thread than the one parsing.
+ * @param parser Parser handle
+ * @param events Output array (caller allocated)
+ * @param max_count Maximum number of events to retrieve
+ * @return Actual number of events copied and removed from the queue
+ */
+size_t orip_drain_events(orip_parser_t* parser,
+                         orip_event_t* events,
+                         size_t max_count);
+
 #ifdef __cplusplus
 }
 #endif
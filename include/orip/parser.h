@@ -3,6 +3,7 @@
 
 #include "orip/types.h"
 #include <memory>
+#include <string_view>
 #include <vector>
 #include <functional>
 
@@ -57,11 +58,15 @@ public:
     std::vector<UAVObject> getActiveUAVs() const;
 
     // Get a specific UAV by ID (returns nullptr if not found)
-    const UAVObject* getUAV(const std::string& id) const;
+    const UAVObject* getUAV(std::string_view id) const;
 
     // Get count of active UAVs
     size_t getActiveCount() const;
 
+    // Refresh a tracked UAV without re-parsing (signal info and message count)
+    // and invoke the update callback. Returns false if the UAV is not tracked
+    bool touch(std::string_view id, int8_t rssi);
+
     // Clear all tracked UAVs
     void clear();
 
@@ -2,6 +2,8 @@
 #define ORIP_SESSION_MANAGER_H
 
 #include "orip/types.h"
+#include <array>
+#include <string_view>
 #include <unordered_map>
 #include <vector>
 #include <chrono>
@@ -11,23 +13,32 @@ namespace orip {
 
 using UAVCallback = std::function<void(const UAVObject&)>;
 
+// Longest UAV ID the session manager tracks. IDs decoded from the air are at
+// most 20 bytes (ASTM F3411 Basic ID); longer IDs are not tracked.
+constexpr size_t MAX_TRACKED_ID_LENGTH = 32;
+
 class SessionManager {
 public:
     explicit SessionManager(uint32_t timeout_ms = 30000);
 
     // Update or add a UAV
-    // Returns true if this is a new UAV
+    // Returns true if this is a new UAV (false for empty or over-long IDs)
     bool update(const UAVObject& uav);
 
     // Get all active UAVs
     std::vector<UAVObject> getActiveUAVs() const;
 
     // Get a specific UAV by ID
-    const UAVObject* getUAV(const std::string& id) const;
+    // The pointer is invalidated by the next update, cleanup or clear
+    const UAVObject* getUAV(std::string_view id) const;
 
     // Get count of active UAVs
     size_t count() const;
 
+    // Refresh a known UAV seen again with an unchanged payload and invoke
+    // the update callback. Returns false if the UAV is not tracked
+    bool touch(std::string_view id, int8_t rssi);
+
     // Remove timed-out UAVs
     // Returns list of removed UAV IDs
     std::vector<std::string> cleanup();
@@ -41,7 +52,37 @@ public:
     void setOnUAVTimeout(UAVCallback callback);
 
 private:
-    std::unordered_map<std::string, UAVObject> uavs_;
+    // ID stored inline, so lookups hash and compare a fixed-size buffer
+    // rather than building a heap-allocated std::string
+    struct IDKey {
+        std::array<char, MAX_TRACKED_ID_LENGTH> bytes{};
+        uint8_t length = 0;
+
+        bool operator==(const IDKey& other) const {
+            return length == other.length && bytes == other.bytes;
+        }
+    };
+
+    struct IDKeyHash {
+        size_t operator()(const IDKey& key) const {
+            return std::hash<std::string_view>{}(
+                std::string_view(key.bytes.data(), key.length));
+        }
+    };
+
+    // Returns false if id is too long to track
+    static bool makeKey(std::string_view id, IDKey& key);
+
+    UAVObject* find(std::string_view id);
+    const UAVObject* find(std::string_view id) const;
+
+    // Remove the UAV at pos by moving the last UAV into its slot
+    void removeAt(size_t pos);
+
+    // UAVs are stored contiguously so snapshots are a linear copy;
+    // index_ maps each ID to its position in uavs_
+    std::vector<UAVObject> uavs_;
+    std::unordered_map<IDKey, size_t, IDKeyHash> index_;
     std::chrono::milliseconds timeout_;
 
     UAVCallback on_new_uav_;
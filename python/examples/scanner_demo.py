@@ -5,10 +5,10 @@ ORIP Python Example - Drone Scanner Demo
 This example demonstrates using the ORIP library to detect and track drones.
 """
 
-from orip import RemoteIDParser, TransportType, UAVObject
+from orip import RemoteIDParser, TransportType, UAVView
 
 
-def on_new_drone(uav: UAVObject):
+def on_new_drone(uav: UAVView):
     """Callback for new drone detection."""
     print(f"\n[NEW] Drone detected!")
     print(f"  ID: {uav.id}")
@@ -16,7 +16,7 @@ def on_new_drone(uav: UAVObject):
     print(f"  RSSI: {uav.rssi} dBm")
 
 
-def on_drone_update(uav: UAVObject):
+def on_drone_update(uav: UAVView):
     """Callback for drone updates."""
     if uav.location.valid:
         print(f"[UPDATE] {uav.id}: "
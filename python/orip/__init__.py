@@ -11,10 +11,13 @@ from .types import (
     UAVIdType,
     UAVType,
     UAVStatus,
+    UAVEventType,
     LocationData,
     SystemInfo,
     UAVObject,
+    UAVView,
     ParseResult,
+    UAVEvent,
     ParserConfig,
 )
 
@@ -26,9 +29,12 @@ __all__ = [
     "UAVIdType",
     "UAVType",
     "UAVStatus",
+    "UAVEventType",
     "LocationData",
     "SystemInfo",
     "UAVObject",
+    "UAVView",
     "ParseResult",
+    "UAVEvent",
     "ParserConfig",
 ]
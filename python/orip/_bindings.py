@@ -8,9 +8,11 @@ from ctypes import (
     c_int, c_int8, c_uint8, c_uint16, c_uint32, c_uint64,
     c_float, c_double, c_char, c_char_p, c_size_t, c_void_p,
 )
+import functools
 import os
 import sys
 from pathlib import Path
+from typing import Any, Optional, Tuple
 
 
 # Constants matching orip_c.h
@@ -79,6 +81,14 @@ class CResult(Structure):
     ]
 
 
+class CEvent(Structure):
+    """C struct: orip_event_t"""
+    _fields_ = [
+        ("type", c_int),
+        ("uav", CUAV),
+    ]
+
+
 class CConfig(Structure):
     """C struct: orip_config_t"""
     _fields_ = [
@@ -94,45 +104,142 @@ class CConfig(Structure):
 UAVCallbackType = CFUNCTYPE(None, POINTER(CUAV), c_void_p)
 
 
+def _library_cache_file() -> Path:
+    """Location of the cached library path."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "orip" / "libpath"
+
+
+def _read_cached_library(version: str) -> Optional[str]:
+    """Return the cached library path if it is for this version and still exists."""
+    try:
+        cached_version, lib_path = _library_cache_file().read_text().split("\n")[:2]
+    except (OSError, ValueError):
+        return None
+    if cached_version == version and Path(lib_path).is_file():
+        return lib_path
+    return None
+
+
+def _write_cached_library(version: str, lib_path: str) -> None:
+    """Remember the resolved library path for later processes (best effort)."""
+    cache_file = _library_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(f"{version}\n{lib_path}\n")
+    except OSError:
+        pass
+
+
 def _find_library() -> str:
     """Find the orip shared library."""
+    # Explicit override
+    env_path = os.environ.get("ORIP_LIBRARY_PATH")
+    if env_path and Path(env_path).is_file():
+        return env_path
+
+    from . import __version__
+
     lib_name = {
         "linux": "liborip.so",
         "darwin": "liborip.dylib",
         "win32": "orip.dll",
     }.get(sys.platform, "liborip.so")
 
-    # Search paths
-    search_paths = [
+    # Libraries shipped with or built next to the package always win, so a
+    # fresh build is never shadowed by a stale cached path
+    package_paths = [
         # Same directory as this module
         Path(__file__).parent,
         # Package lib directory
         Path(__file__).parent / "lib",
         # Project build directory
         Path(__file__).parent.parent.parent / "build",
-        # System paths
-        Path("/usr/local/lib"),
-        Path("/usr/lib"),
     ]
+    for path in package_paths:
+        lib_path = path / lib_name
+        if lib_path.exists():
+            return str(lib_path)
 
-    # Also check LD_LIBRARY_PATH / DYLD_LIBRARY_PATH
+    # LD_LIBRARY_PATH / DYLD_LIBRARY_PATH can change between processes, so
+    # its entries are searched on every load and before the cached path
     env_paths = os.environ.get(
         "DYLD_LIBRARY_PATH" if sys.platform == "darwin" else "LD_LIBRARY_PATH",
         ""
     )
     for p in env_paths.split(":"):
         if p:
-            search_paths.append(Path(p))
+            lib_path = Path(p) / lib_name
+            if lib_path.exists():
+                return str(lib_path)
+
+    cached = _read_cached_library(__version__)
+    if cached:
+        return cached
+
+    # System paths
+    search_paths = [
+        Path("/usr/local/lib"),
+        Path("/usr/lib"),
+    ]
 
     for path in search_paths:
         lib_path = path / lib_name
         if lib_path.exists():
+            _write_cached_library(__version__, str(lib_path))
             return str(lib_path)
 
     # Try loading by name (system search)
     return lib_name
 
 
+# C function prototypes: (name, argtypes, restype)
+_FUNCTION_SIGNATURES: Tuple[Tuple[str, list, Any], ...] = (
+    ("orip_version", [], c_char_p),
+    ("orip_default_config", [], CConfig),
+    ("orip_create", [], c_void_p),
+    ("orip_create_with_config", [POINTER(CConfig)], c_void_p),
+    ("orip_destroy", [c_void_p], None),
+    ("orip_parse", [
+        c_void_p,           # parser
+        c_char_p,           # payload (bytes are passed by buffer pointer)
+        c_size_t,           # payload_len
+        c_int8,             # rssi
+        c_int,              # transport
+        POINTER(CResult),   # result
+    ], c_int),
+    ("orip_parse_batch", [
+        c_void_p,                   # parser
+        POINTER(POINTER(c_uint8)),  # payloads
+        POINTER(c_size_t),          # payload_lens
+        POINTER(c_int8),            # rssis
+        POINTER(c_int),             # transports
+        c_size_t,                   # count
+        POINTER(CResult),           # results
+    ], c_int),
+    ("orip_get_active_count", [c_void_p], c_size_t),
+    ("orip_get_active_uavs", [
+        c_void_p,       # parser
+        POINTER(CUAV),  # uavs
+        c_size_t,       # max_count
+    ], c_size_t),
+    ("orip_get_uav", [c_void_p, c_char_p, POINTER(CUAV)], c_int),
+    ("orip_touch", [c_void_p, c_char_p, c_int8, POINTER(CUAV)], c_int),
+    ("orip_clear", [c_void_p], None),
+    ("orip_cleanup", [c_void_p], c_size_t),
+    ("orip_set_on_new_uav", [c_void_p, UAVCallbackType, c_void_p], None),
+    ("orip_set_on_uav_update", [c_void_p, UAVCallbackType, c_void_p], None),
+    ("orip_set_on_uav_timeout", [c_void_p, UAVCallbackType, c_void_p], None),
+    ("orip_set_event_queue", [c_void_p, c_int], None),
+    ("orip_pending_events", [c_void_p], c_size_t),
+    ("orip_drain_events", [
+        c_void_p,         # parser
+        POINTER(CEvent),  # events
+        c_size_t,         # max_count
+    ], c_size_t),
+)
+
+
 class ORIPLib:
     """Wrapper for the ORIP C library."""
 
@@ -148,74 +255,15 @@ class ORIPLib:
     def _load_library(self):
         """Load the shared library and set up function signatures."""
         lib_path = _find_library()
+        # CDLL (unlike PyDLL) drops the GIL for the duration of every foreign
+        # call, so orip_parse/orip_get_active_uavs/orip_cleanup on separate
+        # parser handles run in parallel across Python threads.
         self._lib = ctypes.CDLL(lib_path)
 
-        # orip_version
-        self._lib.orip_version.argtypes = []
-        self._lib.orip_version.restype = c_char_p
-
-        # orip_default_config
-        self._lib.orip_default_config.argtypes = []
-        self._lib.orip_default_config.restype = CConfig
-
-        # orip_create
-        self._lib.orip_create.argtypes = []
-        self._lib.orip_create.restype = c_void_p
-
-        # orip_create_with_config
-        self._lib.orip_create_with_config.argtypes = [POINTER(CConfig)]
-        self._lib.orip_create_with_config.restype = c_void_p
-
-        # orip_destroy
-        self._lib.orip_destroy.argtypes = [c_void_p]
-        self._lib.orip_destroy.restype = None
-
-        # orip_parse
-        self._lib.orip_parse.argtypes = [
-            c_void_p,           # parser
-            POINTER(c_uint8),   # payload
-            c_size_t,           # payload_len
-            c_int8,             # rssi
-            c_int,              # transport
-            POINTER(CResult),   # result
-        ]
-        self._lib.orip_parse.restype = c_int
-
-        # orip_get_active_count
-        self._lib.orip_get_active_count.argtypes = [c_void_p]
-        self._lib.orip_get_active_count.restype = c_size_t
-
-        # orip_get_active_uavs
-        self._lib.orip_get_active_uavs.argtypes = [
-            c_void_p,       # parser
-            POINTER(CUAV),  # uavs
-            c_size_t,       # max_count
-        ]
-        self._lib.orip_get_active_uavs.restype = c_size_t
-
-        # orip_get_uav
-        self._lib.orip_get_uav.argtypes = [c_void_p, c_char_p, POINTER(CUAV)]
-        self._lib.orip_get_uav.restype = c_int
-
-        # orip_clear
-        self._lib.orip_clear.argtypes = [c_void_p]
-        self._lib.orip_clear.restype = None
-
-        # orip_cleanup
-        self._lib.orip_cleanup.argtypes = [c_void_p]
-        self._lib.orip_cleanup.restype = c_size_t
-
-        # orip_set_on_new_uav
-        self._lib.orip_set_on_new_uav.argtypes = [c_void_p, UAVCallbackType, c_void_p]
-        self._lib.orip_set_on_new_uav.restype = None
-
-        # orip_set_on_uav_update
-        self._lib.orip_set_on_uav_update.argtypes = [c_void_p, UAVCallbackType, c_void_p]
-        self._lib.orip_set_on_uav_update.restype = None
-
-        # orip_set_on_uav_timeout
-        self._lib.orip_set_on_uav_timeout.argtypes = [c_void_p, UAVCallbackType, c_void_p]
-        self._lib.orip_set_on_uav_timeout.restype = None
+        for name, argtypes, restype in _FUNCTION_SIGNATURES:
+            func = getattr(self._lib, name)
+            func.argtypes = argtypes
+            func.restype = restype
 
     @property
     def lib(self):
@@ -223,6 +271,7 @@ class ORIPLib:
 
 
 # Global library instance
+@functools.lru_cache(maxsize=None)
 def get_lib():
     """Get the ORIP library instance."""
     return ORIPLib().lib
@@ -3,8 +3,15 @@ RemoteIDParser - Main parser class for ORIP.
 """
 
 import ctypes
-from ctypes import POINTER, c_uint8, c_int8, byref
-from typing import List, Optional, Callable
+import struct
+import weakref
+from collections import OrderedDict
+from dataclasses import replace
+from ctypes import (
+    POINTER, c_uint8, c_int8, c_int, c_char_p, c_size_t, byref,
+    c_uint16, c_uint32, c_uint64, c_float, c_double,
+)
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 from .types import (
     ProtocolType,
@@ -12,69 +19,413 @@ from .types import (
     UAVIdType,
     UAVType,
     UAVStatus,
+    UAVEventType,
     LocationData,
     SystemInfo,
     UAVObject,
+    UAVView,
     ParseResult,
+    UAVEvent,
     ParserConfig,
 )
 from ._bindings import (
     get_lib,
+    CLocation,
+    CSystemInfo,
     CUAV,
     CResult,
+    CEvent,
     CConfig,
     UAVCallbackType,
 )
 
 
+# Python-side duplicate advertisement cache (ParserConfig.enable_python_dedup):
+# (transport, payload) -> (protocol, private UAV copy, raw UAV id)
+_DEDUP_CACHE_SIZE = 256
+_DedupKey = Tuple[int, bytes]
+_DedupEntry = Tuple[ProtocolType, UAVObject, bytes]
+
+# Largest batch whose result array is kept for reuse between parse_batch calls
+_MAX_BATCH_SCRATCH = 256
+
+# parse_ble_legacy fast path: AD length byte + 0x16 + UUID + counter + message
+_BLE_LEGACY_ADV_LEN = 30
+_BT_LEGACY_INT = int(TransportType.BT_LEGACY)
+
+# RSSI crosses the C API as int8_t; ctypes would silently wrap larger values
+_RSSI_MIN = -128
+_RSSI_MAX = 127
+_RSSI_RANGE_ERROR = "rssi must be between -128 and 127 dBm"
+
+# Initial capacity for get_active_uavs; only larger fleets need a count call
+_ACTIVE_UAVS_DEFAULT_CAP = 64
+
+# Any object supporting the buffer protocol with byte-sized items
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Parser callbacks receive a lazily converted, read-only view of the UAV
+UAVCallback = Callable[[UAVView], None]
+
+# Payload as handed to the library: a pointer into a bytes object, or a
+# c_uint8 array wrapping or copying any other buffer
+_CPayload = Union["ctypes._Pointer[c_uint8]", "ctypes.Array[c_uint8]"]
+
+
+# Byte signatures every library decoder looks for before decoding a frame:
+# ODID BLE service data (AD type 0x16, UUID 0xFFFA), the ASTM WiFi vendor IE
+# (OUI FA:0B:BC, type 0x0D) and the WiFi NAN service ID. Keep in sync with the
+# isRemoteID() checks in src/protocols.
+_REMOTE_ID_SIGNATURES = (
+    b"\x16\xfa\xff",
+    b"\xfa\x0b\xbc\x0d",
+    b"\x88\x69\x19\x9d\x92\x09",
+)
+
+
+def _is_remote_id_candidate(payload: BytesLike) -> bool:
+    """
+    Cheap pre-filter run before crossing into the library.
+
+    Returns False only for payloads no decoder can accept, so those frames
+    (the majority in a real BLE scan) never pay for the FFI call.
+    """
+    if not isinstance(payload, (bytes, bytearray)):
+        return True
+    for signature in _REMOTE_ID_SIGNATURES:
+        if signature in payload:
+            return True
+    return False
+
+
+# ParseResult is frozen and failures carry no UAV, so failure results are
+# shared instead of being rebuilt on every call
+_NO_DECODER_RESULT = ParseResult(
+    False, False, ProtocolType.UNKNOWN, "No matching protocol decoder"
+)
+_EMPTY_PAYLOAD_RESULT = ParseResult(False, False, ProtocolType.UNKNOWN, "Empty payload")
+_INTERNAL_ERROR_RESULT = ParseResult(False, False, ProtocolType.UNKNOWN, "Internal error")
+
+# (is_remote_id, protocol, raw error) -> shared failure result. The library's
+# error messages are fixed strings, so this stays small; the cap is a guard.
+_FAILURE_RESULTS: Dict[Tuple[int, int, bytes], ParseResult] = {}
+_FAILURE_RESULTS_MAX = 64
+
+# Never a valid success flag; marks result slots the library did not write
+_UNWRITTEN = -1
+
+
+def _not_remote_id_result(payload: BytesLike) -> ParseResult:
+    """Result the library returns for a payload no decoder recognizes."""
+    return _NO_DECODER_RESULT if len(payload) else _EMPTY_PAYLOAD_RESULT
+
+
+def _payload_to_c(payload: BytesLike) -> Tuple[_CPayload, int]:
+    """
+    Get a C pointer to payload data without element-wise copying.
+
+    Immutable bytes are passed by pointer to their own buffer; writable
+    buffers (bytearray, memoryview from a socket) are wrapped in place;
+    read-only and non-contiguous buffers (e.g. ``memoryview(b)[::2]``) are
+    copied once.
+    """
+    if isinstance(payload, bytes):
+        # ctypes passes bytes as a char* to their buffer; the caller keeps
+        # the bytes object alive for the duration of the call
+        ptr = ctypes.cast(payload, POINTER(c_uint8))  # type: ignore[arg-type]
+        return ptr, len(payload)
+
+    view = memoryview(payload)
+    if not view.c_contiguous:
+        data = bytes(view)
+        return (c_uint8 * len(data)).from_buffer_copy(data), len(data)
+
+    view = view.cast("B")
+    if view.readonly:
+        return (c_uint8 * view.nbytes).from_buffer_copy(view), view.nbytes
+    return (c_uint8 * view.nbytes).from_buffer(view), view.nbytes
+
+
+def _convert_cresult_to_python(result: CResult) -> ParseResult:
+    """Convert C result struct to Python dataclass."""
+    if not result.success:
+        # Failures never carry a UAV, so leave the embedded struct untouched.
+        # c_char array fields already stop at the first NUL, no rstrip needed
+        raw_error = result.error
+        key = (result.is_remote_id, result.protocol, raw_error)
+        failure = _FAILURE_RESULTS.get(key)
+        if failure is None:
+            failure = ParseResult(
+                False,
+                bool(result.is_remote_id),
+                ProtocolType.from_int(result.protocol),
+                raw_error.decode("utf-8", errors="replace") or None,
+            )
+            if len(_FAILURE_RESULTS) < _FAILURE_RESULTS_MAX:
+                _FAILURE_RESULTS[key] = failure
+        return failure
+
+    protocol = ProtocolType.from_int(result.protocol)
+
+    # The library only sets an error message on failure
+    return ParseResult(
+        True, bool(result.is_remote_id), protocol, None,
+        _convert_cuav_to_python(result.uav),
+    )
+
+
+def _decode_c_string(buf: bytes) -> str:
+    """Decode a fixed-size, NUL-padded C char array."""
+    # Decode only up to the terminator rather than the whole padded field
+    return buf.partition(b"\x00")[0].decode("utf-8", errors="replace")
+
+
+def _convert_location(cloc: CLocation) -> LocationData:
+    """Convert C location struct to Python dataclass."""
+    return LocationData(
+        valid=bool(cloc.valid),
+        latitude=cloc.latitude,
+        longitude=cloc.longitude,
+        altitude_baro=cloc.altitude_baro,
+        altitude_geo=cloc.altitude_geo,
+        height=cloc.height,
+        speed_horizontal=cloc.speed_horizontal,
+        speed_vertical=cloc.speed_vertical,
+        direction=cloc.direction,
+        status=UAVStatus.from_int(cloc.status),
+    )
+
+
+def _convert_system(csys: CSystemInfo) -> SystemInfo:
+    """Convert C system info struct to Python dataclass."""
+    return SystemInfo(
+        valid=bool(csys.valid),
+        operator_latitude=csys.operator_latitude,
+        operator_longitude=csys.operator_longitude,
+        area_ceiling=csys.area_ceiling,
+        area_floor=csys.area_floor,
+        area_count=csys.area_count,
+        area_radius=csys.area_radius,
+        timestamp=csys.timestamp,
+    )
+
+
+# struct codes for the scalar ctypes used in the C structs
+_STRUCT_CODES = {
+    c_int: "i",
+    c_int8: "b",
+    c_uint16: "H",
+    c_uint32: "I",
+    c_uint64: "Q",
+    c_float: "f",
+    c_double: "d",
+}
+
+
+def _struct_format(ctype) -> str:
+    """Build a struct format string matching a ctypes Structure's memory layout."""
+    fmt = []
+    pos = 0
+    for name, field_type in ctype._fields_:
+        offset = getattr(ctype, name).offset
+        if offset > pos:
+            fmt.append(f"{offset - pos}x")
+        if issubclass(field_type, ctypes.Structure):
+            fmt.append(_struct_format(field_type))
+        elif issubclass(field_type, ctypes.Array):
+            fmt.append(f"{field_type._length_}s")
+        else:
+            fmt.append(_STRUCT_CODES[field_type])
+        pos = offset + ctypes.sizeof(field_type)
+    if ctypes.sizeof(ctype) > pos:
+        fmt.append(f"{ctypes.sizeof(ctype) - pos}x")
+    return "".join(fmt)
+
+
+# Unpacks a whole CUAV memory image in one call
+_UAV_STRUCT = struct.Struct("=" + _struct_format(CUAV))
+assert _UAV_STRUCT.size == ctypes.sizeof(CUAV)
+
+
+_uav_dtype = None
+
+
+def _get_uav_dtype():
+    """Build (once) a numpy dtype matching the CUAV memory layout."""
+    global _uav_dtype
+    if _uav_dtype is None:
+        import numpy as np
+
+        def build(ctype):
+            names, formats, offsets = [], [], []
+            for name, field_type in ctype._fields_:
+                names.append(name)
+                offsets.append(getattr(ctype, name).offset)
+                if issubclass(field_type, ctypes.Structure):
+                    formats.append(build(field_type))
+                elif issubclass(field_type, ctypes.Array):
+                    formats.append(f"S{field_type._length_}")
+                else:
+                    formats.append(np.dtype(field_type))
+            return np.dtype({
+                "names": names,
+                "formats": formats,
+                "offsets": offsets,
+                "itemsize": ctypes.sizeof(ctype),
+            })
+
+        _uav_dtype = build(CUAV)
+    return _uav_dtype
+
+
+# Per-field converters from CUAV, used by _LazyUAV. Reading a c_char array
+# field returns its bytes up to the first NUL, so strings decode directly.
+_UAV_FIELD_CONVERTERS = {
+    "id": lambda c: c.id.decode("utf-8", errors="replace"),
+    "id_type": lambda c: UAVIdType.from_int(c.id_type),
+    "uav_type": lambda c: UAVType.from_int(c.uav_type),
+    "protocol": lambda c: ProtocolType.from_int(c.protocol),
+    "transport": lambda c: TransportType.from_int(c.transport),
+    "rssi": lambda c: c.rssi,
+    "last_seen_ms": lambda c: c.last_seen_ms,
+    "location": lambda c: _convert_location(c.location),
+    "system": lambda c: _convert_system(c.system),
+    "self_id_description": lambda c: (
+        c.self_id_description.decode("utf-8", errors="replace")
+        if c.has_self_id else None
+    ),
+    "operator_id": lambda c: (
+        c.operator_id.decode("utf-8", errors="replace")
+        if c.has_operator_id else None
+    ),
+    "message_count": lambda c: c.message_count,
+}
+
+
 def _convert_cuav_to_python(cuav: CUAV) -> UAVObject:
     """Convert C UAV struct to Python dataclass."""
+    return _uav_from_fields(_UAV_STRUCT.unpack_from(cuav))
+
+
+def _copy_uav(uav: UAVObject, rssi: int, last_seen_ms: int) -> UAVObject:
+    """Copy a UAVObject (including its nested records) with new signal info."""
+    return UAVObject(
+        uav.id,
+        uav.id_type,
+        uav.uav_type,
+        uav.protocol,
+        uav.transport,
+        rssi,
+        last_seen_ms,
+        replace(uav.location),
+        replace(uav.system),
+        uav.self_id_description,
+        uav.operator_id,
+        uav.message_count,
+    )
+
+
+def _uav_from_fields(fields: tuple) -> UAVObject:
+    """Build a UAVObject from a tuple unpacked with _UAV_STRUCT."""
+    (
+        uav_id, id_type, uav_type, protocol, transport, rssi, last_seen_ms,
+        loc_valid, latitude, longitude, altitude_baro, altitude_geo, height,
+        speed_horizontal, speed_vertical, direction, status,
+        sys_valid, operator_latitude, operator_longitude, area_ceiling,
+        area_floor, area_count, area_radius, timestamp,
+        has_self_id, self_id_description, has_operator_id, operator_id,
+        message_count,
+    ) = fields
+
+    # Positional construction (faster than keywords); order follows types.py
     location = LocationData(
-        valid=bool(cuav.location.valid),
-        latitude=cuav.location.latitude,
-        longitude=cuav.location.longitude,
-        altitude_baro=cuav.location.altitude_baro,
-        altitude_geo=cuav.location.altitude_geo,
-        height=cuav.location.height,
-        speed_horizontal=cuav.location.speed_horizontal,
-        speed_vertical=cuav.location.speed_vertical,
-        direction=cuav.location.direction,
-        status=UAVStatus(cuav.location.status),
+        bool(loc_valid),
+        latitude,
+        longitude,
+        altitude_baro,
+        altitude_geo,
+        height,
+        speed_horizontal,
+        speed_vertical,
+        direction,
+        UAVStatus.from_int(status),
     )
 
     system = SystemInfo(
-        valid=bool(cuav.system.valid),
-        operator_latitude=cuav.system.operator_latitude,
-        operator_longitude=cuav.system.operator_longitude,
-        area_ceiling=cuav.system.area_ceiling,
-        area_floor=cuav.system.area_floor,
-        area_count=cuav.system.area_count,
-        area_radius=cuav.system.area_radius,
-        timestamp=cuav.system.timestamp,
+        bool(sys_valid),
+        operator_latitude,
+        operator_longitude,
+        area_ceiling,
+        area_floor,
+        area_count,
+        area_radius,
+        timestamp,
     )
 
     return UAVObject(
-        id=cuav.id.decode("utf-8", errors="replace").rstrip("\x00"),
-        id_type=UAVIdType(cuav.id_type),
-        uav_type=UAVType(cuav.uav_type),
-        protocol=ProtocolType(cuav.protocol),
-        transport=TransportType(cuav.transport),
-        rssi=cuav.rssi,
-        last_seen_ms=cuav.last_seen_ms,
-        location=location,
-        system=system,
-        self_id_description=(
-            cuav.self_id_description.decode("utf-8", errors="replace").rstrip("\x00")
-            if cuav.has_self_id else None
-        ),
-        operator_id=(
-            cuav.operator_id.decode("utf-8", errors="replace").rstrip("\x00")
-            if cuav.has_operator_id else None
-        ),
-        message_count=cuav.message_count,
+        _decode_c_string(uav_id),
+        UAVIdType.from_int(id_type),
+        UAVType.from_int(uav_type),
+        ProtocolType.from_int(protocol),
+        TransportType.from_int(transport),
+        rssi,
+        last_seen_ms,
+        location,
+        system,
+        _decode_c_string(self_id_description) if has_self_id else None,
+        _decode_c_string(operator_id) if has_operator_id else None,
+        message_count,
     )
 
 
+class _LazyUAV:
+    """
+    View of a UAV passed to callbacks (implements UAVView).
+
+    Exposes the same attributes as UAVObject, but converts each field from
+    the C struct only when it is first accessed; later reads return the
+    same objects. Call materialize() to get a full UAVObject snapshot.
+    Copying or pickling a view yields its materialized UAVObject.
+    """
+
+    __slots__ = ("_c", "_cache")
+
+    def __init__(self, cuav: CUAV):
+        # The C struct only lives for the duration of the callback, so keep a copy
+        self._c = CUAV.from_buffer_copy(cuav)
+        self._cache: Dict[str, Any] = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            # Unset slots (e.g. on a copy made without __init__) and dunder
+            # probes must not fall through to self._cache
+            raise AttributeError(name)
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        try:
+            convert = _UAV_FIELD_CONVERTERS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = cache[name] = convert(self._c)
+        return value
+
+    def materialize(self) -> UAVObject:
+        """Convert all fields into a UAVObject."""
+        return _convert_cuav_to_python(self._c)
+
+    def __reduce__(self):
+        return _uav_from_fields, (_UAV_STRUCT.unpack_from(self._c),)
+
+    def __repr__(self):
+        return f"<UAV view id={self.id!r}>"
+
+
+def _cleanup(lib, handle) -> None:
+    """Destroy a native parser handle (run by the parser's finalizer)."""
+    lib.orip_destroy(handle)
+
+
 class RemoteIDParser:
     """
     Remote ID Parser for detecting and parsing drone identification signals.
@@ -90,8 +441,29 @@ class RemoteIDParser:
         >>> with RemoteIDParser() as parser:
         ...     result = parser.parse(payload, -70)
         ...     print(result.uav.id if result.success else result.error)
+
+    The GIL is released inside the native calls, so one parser per thread
+    (e.g. one per BLE adapter) scales across cores. A single instance is
+    not thread-safe and must not be shared between threads without a lock.
+
+    Each parser reuses one result buffer across calls, so parse() and the
+    batch methods are not reentrant: do not call them on the same parser
+    from one of its callbacks.
     """
 
+    __slots__ = (
+        "_lib",
+        "_handle",
+        "_cb_new",
+        "_cb_update",
+        "_cb_timeout",
+        "_dedup_cache",
+        "_scratch_result",
+        "_batch_scratch",
+        "_finalizer",
+        "__weakref__",
+    )
+
     def __init__(self, config: Optional[ParserConfig] = None):
         """
         Create a new parser instance.
@@ -101,7 +473,19 @@ class RemoteIDParser:
         """
         self._lib = get_lib()
         self._handle = None
-        self._callbacks = {}  # Keep references to prevent garbage collection
+        # Registered C callbacks; references keep them from being collected
+        self._cb_new = None
+        self._cb_update = None
+        self._cb_timeout = None
+        # (transport, payload) -> (protocol, private UAV copy, raw UAV id); None when disabled
+        self._dedup_cache: Optional["OrderedDict[_DedupKey, _DedupEntry]"] = None
+        # Reused output structs; orip_parse zeroes them on every call
+        self._scratch_result = CResult()
+        self._batch_scratch = (CResult * 0)()
+        self._finalizer = None
+
+        if config and config.enable_python_dedup:
+            self._dedup_cache = OrderedDict()
 
         if config:
             c_config = CConfig(
@@ -118,6 +502,13 @@ class RemoteIDParser:
         if not self._handle:
             raise RuntimeError("Failed to create parser")
 
+        if config and config.enable_event_queue:
+            self._lib.orip_set_event_queue(self._handle, 1)
+
+        # Destroys the handle if the parser is collected without close(); unlike
+        # __del__ this does not keep callback reference cycles alive
+        self._finalizer = weakref.finalize(self, _cleanup, self._lib, self._handle)
+
     def __enter__(self):
         return self
 
@@ -128,91 +519,407 @@ class RemoteIDParser:
     def close(self):
         """Release parser resources."""
         if self._handle:
-            self._lib.orip_destroy(self._handle)
+            self._finalizer()  # Idempotent; detaches from garbage collection
             self._handle = None
-            self._callbacks.clear()
-
-    def __del__(self):
-        self.close()
+            self._cb_new = None
+            self._cb_update = None
+            self._cb_timeout = None
+            if self._dedup_cache is not None:
+                self._dedup_cache.clear()
 
     def _check_handle(self):
         if not self._handle:
             raise RuntimeError("Parser has been closed")
 
+    def _parse_batch_into(self, payloads, lens, rssis, transports, count, results):
+        """
+        Call orip_parse_batch, raising if the call as a whole was rejected.
+
+        A payload that fails internally is reported in its own result slot;
+        a rejected call writes no slot at all, which the marker detects.
+        """
+        results[0].success = _UNWRITTEN
+        ret = self._lib.orip_parse_batch(
+            self._handle, payloads, lens, rssis, transports, count, results
+        )
+        if ret != 0 and results[0].success == _UNWRITTEN:
+            raise RuntimeError("orip_parse_batch failed")
+
+    @staticmethod
+    def _make_trampoline(callback: UAVCallback):
+        """Wrap a Python callable in a C callback."""
+        def wrapper(cuav_ptr, user_data):
+            callback(_LazyUAV(cuav_ptr.contents))
+
+        return UAVCallbackType(wrapper)
+
     def parse(
         self,
-        payload: bytes,
+        payload: BytesLike,
         rssi: int = 0,
         transport: TransportType = TransportType.BT_LEGACY,
     ) -> ParseResult:
         """
         Parse a raw Bluetooth or WiFi payload.
 
+        The C result buffer is reused between calls, so parse() must not be
+        called re-entrantly on the same parser (e.g. from one of its callbacks).
+
         Args:
-            payload: Raw advertisement/beacon data
+            payload: Raw advertisement/beacon data (bytes or any buffer such as
+                bytearray, memoryview or array.array)
             rssi: Signal strength in dBm
             transport: Transport type (BT_LEGACY, BT_EXTENDED, WIFI_BEACON, etc.)
 
         Returns:
-            ParseResult containing success status and parsed UAV data
+            ParseResult containing success status and parsed UAV data.
+            With ParserConfig.enable_python_dedup, a repeated payload is not
+            decoded again: the result is a new copy of its first successful
+            parse with the current RSSI and time, and the tracked UAV is
+            refreshed (firing the update callback) as a full parse would.
+
+        Raises:
+            OverflowError: If rssi does not fit in a signed byte
         """
         self._check_handle()
+        if not _RSSI_MIN <= rssi <= _RSSI_MAX:
+            raise OverflowError(_RSSI_RANGE_ERROR)
+
+        if not _is_remote_id_candidate(payload):
+            return _not_remote_id_result(payload)
 
-        # Convert payload to ctypes array
-        payload_array = (c_uint8 * len(payload))(*payload)
-        result = CResult()
+        dedup_cache = self._dedup_cache
+        dedup_key: Optional[_DedupKey] = None
+        if dedup_cache is not None:
+            dedup_key = (
+                transport,
+                payload if isinstance(payload, bytes) else bytes(payload),
+            )
+            cached = dedup_cache.get(dedup_key)
+            if cached is not None:
+                protocol, cached_uav, raw_id = cached
+                # Refresh the tracked UAV without decoding (this also fires the
+                # update callback); fall through to a full parse if it has been
+                # dropped (timeout, clear)
+                touched = self._scratch_result.uav
+                ret = self._lib.orip_touch(self._handle, raw_id, rssi, byref(touched))
+                if ret == 0:
+                    dedup_cache.move_to_end(dedup_key)
+                    uav = _copy_uav(cached_uav, rssi, touched.last_seen_ms)
+                    return ParseResult(True, True, protocol, None, uav)
+
+        payload_arg: Union[bytes, c_char_p]
+        if type(payload) is bytes:
+            # c_char_p argtype: ctypes hands the bytes buffer straight to C
+            payload_arg, payload_len = payload, len(payload)
+        else:
+            payload_ptr, payload_len = _payload_to_c(payload)
+            payload_arg = ctypes.cast(payload_ptr, c_char_p)
+        result = self._scratch_result
 
         ret = self._lib.orip_parse(
             self._handle,
-            payload_array,
-            len(payload),
-            c_int8(rssi),
-            int(transport),
+            payload_arg,
+            payload_len,
+            rssi,
+            transport,  # IntEnum is an int; ctypes converts it directly
             byref(result),
         )
 
         if ret != 0:
-            return ParseResult(
-                success=False,
-                is_remote_id=False,
-                protocol=ProtocolType.UNKNOWN,
-                error="Internal error",
+            return _INTERNAL_ERROR_RESULT
+
+        parsed = _convert_cresult_to_python(result)
+
+        if dedup_cache is not None and dedup_key is not None and parsed.uav is not None:
+            # Keep a private copy so callers mutating their result cannot
+            # change what later hits return
+            uav = parsed.uav
+            dedup_cache[dedup_key] = (
+                parsed.protocol,
+                _copy_uav(uav, uav.rssi, uav.last_seen_ms),
+                result.uav.id,
             )
+            dedup_cache.move_to_end(dedup_key)
+            if len(dedup_cache) > _DEDUP_CACHE_SIZE:
+                dedup_cache.popitem(last=False)
+
+        return parsed
 
-        uav = None
-        if result.success:
-            uav = _convert_cuav_to_python(result.uav)
+    def parse_ble_legacy(self, payload: bytes, rssi: int = 0) -> ParseResult:
+        """
+        Parse a single ODID BLE legacy advertisement.
 
-        error = result.error.decode("utf-8", errors="replace").rstrip("\x00")
+        Specialized parse() for the common case of a 30-byte ``bytes``
+        advertisement on BT_LEGACY: it skips the pre-filter, buffer conversion
+        and dedup bookkeeping and goes straight to the library. Any other
+        payload (other length or type, or with enable_python_dedup) is
+        handed to parse() unchanged, so results are always identical.
 
-        return ParseResult(
-            success=bool(result.success),
-            is_remote_id=bool(result.is_remote_id),
-            protocol=ProtocolType(result.protocol),
-            error=error if error else None,
-            uav=uav,
+        Args:
+            payload: Raw BLE advertisement data
+            rssi: Signal strength in dBm
+
+        Returns:
+            ParseResult containing success status and parsed UAV data.
+        """
+        if (
+            type(payload) is not bytes
+            or len(payload) != _BLE_LEGACY_ADV_LEN
+            or self._dedup_cache is not None
+        ):
+            return self.parse(payload, rssi, TransportType.BT_LEGACY)
+
+        self._check_handle()
+        if not _RSSI_MIN <= rssi <= _RSSI_MAX:
+            raise OverflowError(_RSSI_RANGE_ERROR)
+        result = self._scratch_result
+
+        if self._lib.orip_parse(
+            self._handle,
+            payload,
+            _BLE_LEGACY_ADV_LEN,
+            rssi,
+            _BT_LEGACY_INT,
+            byref(result),
+        ) != 0:
+            return _INTERNAL_ERROR_RESULT
+
+        return _convert_cresult_to_python(result)
+
+    def parse_batch(
+        self,
+        payloads: Sequence[BytesLike],
+        rssis: Sequence[int],
+        transports: Optional[Sequence[TransportType]] = None,
+    ) -> List[ParseResult]:
+        """
+        Parse a batch of raw Bluetooth or WiFi payloads in a single library call.
+
+        Equivalent to calling parse() for each payload in order, but crosses
+        the FFI boundary only once for the whole batch.
+
+        Args:
+            payloads: Raw advertisement/beacon data, one entry per frame
+            rssis: Signal strength in dBm for each payload
+            transports: Transport type for each payload (defaults to BT_LEGACY)
+
+        Returns:
+            List of ParseResult, one per payload
+
+        Raises:
+            ValueError: If the argument sequences differ in length
+            OverflowError: If any rssi does not fit in a signed byte
+            RuntimeError: If the library rejects the batch
+        """
+        self._check_handle()
+
+        count = len(payloads)
+        if len(rssis) != count:
+            raise ValueError("payloads and rssis must have the same length")
+        if transports is None:
+            transports = [TransportType.BT_LEGACY] * count
+        elif len(transports) != count:
+            raise ValueError("payloads and transports must have the same length")
+        if count == 0:
+            return []
+        if min(rssis) < _RSSI_MIN or max(rssis) > _RSSI_MAX:
+            raise OverflowError(_RSSI_RANGE_ERROR)
+
+        # Only frames that may be Remote ID are sent to the library
+        parsed: List[Optional[ParseResult]] = [None] * count
+        candidates = []
+        for i, payload in enumerate(payloads):
+            if _is_remote_id_candidate(payload):
+                candidates.append(i)
+            else:
+                parsed[i] = _not_remote_id_result(payload)
+
+        count = len(candidates)
+        if count == 0:
+            return cast(List[ParseResult], parsed)
+
+        # Keep the converted buffers alive until the call returns
+        buffers = [_payload_to_c(payloads[i]) for i in candidates]
+        payload_array = (POINTER(c_uint8) * count)(
+            *[ctypes.cast(ptr, POINTER(c_uint8)) for ptr, _ in buffers]
+        )
+        lens_array = (c_size_t * count)(*[n for _, n in buffers])
+        rssis_array = (c_int8 * count)(*[rssis[i] for i in candidates])
+        transports_array = (c_int * count)(*[transports[i] for i in candidates])
+        results = self._batch_scratch
+        if len(results) < count:
+            results = (CResult * count)()
+            if count <= _MAX_BATCH_SCRATCH:
+                self._batch_scratch = results
+
+        self._parse_batch_into(
+            payload_array, lens_array, rssis_array, transports_array, count, results
+        )
+
+        for i, result in zip(candidates, results):
+            parsed[i] = _convert_cresult_to_python(result)
+        # Every slot is filled: non-candidates above, candidates here
+        return cast(List[ParseResult], parsed)
+
+    def parse_many(
+        self,
+        payloads: Sequence[BytesLike],
+        rssis: Sequence[int],
+        transport: TransportType = TransportType.BT_LEGACY,
+    ) -> List[ParseResult]:
+        """
+        Parse many payloads received over the same transport.
+
+        Convenience wrapper around parse_batch() for the common single-adapter
+        case, e.g. a burst of BLE advertisements from one scan.
+
+        Args:
+            payloads: Raw advertisement/beacon data, one entry per frame
+            rssis: Signal strength in dBm for each payload
+            transport: Transport type shared by all payloads
+
+        Returns:
+            List of ParseResult, one per payload
+        """
+        return self.parse_batch(payloads, rssis, [transport] * len(payloads))
+
+    def parse_batch_buffer(
+        self,
+        buf,
+        rssi: int = 0,
+        transport: TransportType = TransportType.BT_LEGACY,
+    ):
+        """
+        Parse every row of a 2-D uint8 numpy array as one payload.
+
+        Meant for fuzzing and bulk replay: rows are passed to the library by
+        pointer in blocks, without a Python object per row, and only each
+        row's success flag is returned. Requires numpy.
+
+        Args:
+            buf: Array of shape (N, L); each row is one L-byte payload
+            rssi: Signal strength in dBm used for every row
+            transport: Transport type used for every row
+
+        Returns:
+            numpy.ndarray of shape (N,) and dtype uint8, 1 where the row parsed
+
+        Raises:
+            ValueError: If buf is not a two-dimensional uint8 array
+            OverflowError: If rssi does not fit in a signed byte
+            RuntimeError: If the library rejects the batch
+        """
+        import numpy as np
+
+        self._check_handle()
+        if not _RSSI_MIN <= rssi <= _RSSI_MAX:
+            raise OverflowError(_RSSI_RANGE_ERROR)
+
+        rows = np.asarray(buf)
+        if rows.dtype != np.uint8 or rows.ndim != 2:
+            raise ValueError("buf must be a 2-D uint8 array of payloads")
+        rows = np.ascontiguousarray(rows)
+
+        count, row_len = rows.shape
+        flags = np.zeros(count, dtype=np.uint8)
+        if count == 0 or row_len == 0:
+            return flags
+
+        block = _MAX_BATCH_SCRATCH
+        results = self._batch_scratch
+        if len(results) < block:
+            results = (CResult * block)()
+            self._batch_scratch = results
+        # The success field of every result struct, viewed in place
+        success = np.ndarray(
+            (block,),
+            dtype=np.intc,
+            buffer=memoryview(results).cast("B"),
+            offset=CResult.success.offset,
+            strides=(ctypes.sizeof(CResult),),
+        )
+
+        pointers = (
+            np.arange(count, dtype=np.uintp) * np.uintp(row_len)
+            + np.uintp(rows.ctypes.data)
         )
+        lens = np.full(block, row_len, dtype=np.uintp)
+        rssis = np.full(block, rssi, dtype=np.int8)
+        transports = np.full(block, int(transport), dtype=np.intc)
+
+        for start in range(0, count, block):
+            n = min(block, count - start)
+            self._parse_batch_into(
+                pointers[start:].ctypes.data_as(POINTER(POINTER(c_uint8))),
+                lens.ctypes.data_as(POINTER(c_size_t)),
+                rssis.ctypes.data_as(POINTER(c_int8)),
+                transports.ctypes.data_as(POINTER(c_int)),
+                n,
+                results,
+            )
+            flags[start:start + n] = success[:n]
+
+        return flags
 
     def get_active_count(self) -> int:
         """Get the number of currently active (recently seen) UAVs."""
         self._check_handle()
         return self._lib.orip_get_active_count(self._handle)
 
+    def _fetch_active_uavs(self):
+        """
+        Copy the active UAVs into a new CUAV array.
+
+        Tries a fixed-size array first and only asks for the active count
+        (a second FFI call) when that array comes back full.
+        """
+        cap = _ACTIVE_UAVS_DEFAULT_CAP
+        uavs_array = (CUAV * cap)()
+        count = self._lib.orip_get_active_uavs(self._handle, uavs_array, cap)
+
+        if count == cap:
+            total = self.get_active_count()
+            if total > cap:
+                uavs_array = (CUAV * total)()
+                count = self._lib.orip_get_active_uavs(
+                    self._handle, uavs_array, total
+                )
+
+        return uavs_array, count
+
     def get_active_uavs(self) -> List[UAVObject]:
         """Get a list of all currently active UAVs."""
         self._check_handle()
 
-        count = self.get_active_count()
-        if count == 0:
-            return []
+        uavs_array, actual_count = self._fetch_active_uavs()
 
-        # Allocate array for results
-        uavs_array = (CUAV * count)()
-        actual_count = self._lib.orip_get_active_uavs(
-            self._handle, uavs_array, count
-        )
+        # Unpack all records in one pass instead of indexing the ctypes array
+        records = memoryview(uavs_array).cast("B")[: actual_count * _UAV_STRUCT.size]
+        return [_uav_from_fields(f) for f in _UAV_STRUCT.iter_unpack(records)]
+
+    def get_active_uavs_soa(self):
+        """
+        Get all currently active UAVs as a numpy structured array.
+
+        Fields mirror the C ``orip_uav_t`` struct, with nested ``location`` and
+        ``system`` records and NUL-padded byte strings for IDs. Useful for
+        vectorized analytics over large fleets without building a UAVObject
+        per drone. Requires numpy.
+
+        Returns:
+            numpy.ndarray with one record per active UAV
+        """
+        import numpy as np
+
+        self._check_handle()
+
+        dtype = _get_uav_dtype()
+        uavs_array, actual_count = self._fetch_active_uavs()
+        if actual_count == 0:
+            return np.empty(0, dtype=dtype)
 
-        return [_convert_cuav_to_python(uavs_array[i]) for i in range(actual_count)]
+        return np.frombuffer(uavs_array, dtype=dtype, count=actual_count)
 
     def get_uav(self, uav_id: str) -> Optional[UAVObject]:
         """
@@ -242,6 +949,8 @@ class RemoteIDParser:
         """Clear all tracked UAVs."""
         self._check_handle()
         self._lib.orip_clear(self._handle)
+        if self._dedup_cache is not None:
+            self._dedup_cache.clear()
 
     def cleanup(self) -> int:
         """
@@ -253,71 +962,109 @@ class RemoteIDParser:
         self._check_handle()
         return self._lib.orip_cleanup(self._handle)
 
-    def set_on_new_uav(self, callback: Optional[Callable[[UAVObject], None]]):
+    def set_event_queue(self, enabled: bool):
+        """
+        Enable or disable queuing of new/update/timeout events.
+
+        Disabling discards any events not yet drained.
+
+        Args:
+            enabled: True to queue events for drain_events()
+        """
+        self._check_handle()
+        self._lib.orip_set_event_queue(self._handle, int(enabled))
+
+    def drain_events(self) -> List[UAVEvent]:
+        """
+        Remove and return the queued events, oldest first.
+
+        Events are queued inside the library while parsing, without calling
+        back into Python, so polling this after a batch is much cheaper than
+        per-UAV callbacks. The queue has its own lock: one thread may drain
+        while another parses. Requires the event queue to be enabled with
+        ParserConfig.enable_event_queue or set_event_queue().
+
+        Returns:
+            List of UAVEvent, empty if nothing is queued
+        """
+        self._check_handle()
+
+        count = self._lib.orip_pending_events(self._handle)
+        if count == 0:
+            return []
+
+        # Events queued after the count call stay for the next drain
+        events_array = (CEvent * count)()
+        count = self._lib.orip_drain_events(self._handle, events_array, count)
+        return [
+            UAVEvent(UAVEventType.from_int(event.type), _convert_cuav_to_python(event.uav))
+            for event in events_array[:count]
+        ]
+
+    def set_on_new_uav(self, callback: Optional[UAVCallback]):
         """
         Set callback for new UAV detection.
 
+        Each callback re-enters Python from inside the native parse call; for
+        high-rate or multi-threaded scanning prefer drain_events().
+
         Args:
-            callback: Function to call when a new UAV is detected, or None to disable
+            callback: Function to call when a new UAV is detected, or None to disable.
+                It receives a read-only UAVView whose fields are converted on
+                access; call ``uav.materialize()`` to get a UAVObject.
         """
         self._check_handle()
 
         if callback is None:
             self._lib.orip_set_on_new_uav(self._handle, UAVCallbackType(), None)
-            self._callbacks.pop("new_uav", None)
+            self._cb_new = None
             return
 
-        def wrapper(cuav_ptr, user_data):
-            uav = _convert_cuav_to_python(cuav_ptr.contents)
-            callback(uav)
-
-        c_callback = UAVCallbackType(wrapper)
-        self._callbacks["new_uav"] = c_callback  # Keep reference
+        # Only the current trampoline per slot is kept; the replaced one is
+        # released once the library no longer points at it
+        c_callback = self._make_trampoline(callback)
         self._lib.orip_set_on_new_uav(self._handle, c_callback, None)
+        self._cb_new = c_callback
 
-    def set_on_uav_update(self, callback: Optional[Callable[[UAVObject], None]]):
+    def set_on_uav_update(self, callback: Optional[UAVCallback]):
         """
         Set callback for UAV updates.
 
         Args:
-            callback: Function to call when a UAV is updated, or None to disable
+            callback: Function to call when a UAV is updated, or None to disable.
+                It receives a read-only UAVView whose fields are converted on
+                access; call ``uav.materialize()`` to get a UAVObject.
         """
         self._check_handle()
 
         if callback is None:
             self._lib.orip_set_on_uav_update(self._handle, UAVCallbackType(), None)
-            self._callbacks.pop("update", None)
+            self._cb_update = None
             return
 
-        def wrapper(cuav_ptr, user_data):
-            uav = _convert_cuav_to_python(cuav_ptr.contents)
-            callback(uav)
-
-        c_callback = UAVCallbackType(wrapper)
-        self._callbacks["update"] = c_callback
+        c_callback = self._make_trampoline(callback)
         self._lib.orip_set_on_uav_update(self._handle, c_callback, None)
+        self._cb_update = c_callback
 
-    def set_on_uav_timeout(self, callback: Optional[Callable[[UAVObject], None]]):
+    def set_on_uav_timeout(self, callback: Optional[UAVCallback]):
         """
         Set callback for UAV timeout (removal).
 
         Args:
-            callback: Function to call when a UAV times out, or None to disable
+            callback: Function to call when a UAV times out, or None to disable.
+                It receives a read-only UAVView whose fields are converted on
+                access; call ``uav.materialize()`` to get a UAVObject.
         """
         self._check_handle()
 
         if callback is None:
             self._lib.orip_set_on_uav_timeout(self._handle, UAVCallbackType(), None)
-            self._callbacks.pop("timeout", None)
+            self._cb_timeout = None
             return
 
-        def wrapper(cuav_ptr, user_data):
-            uav = _convert_cuav_to_python(cuav_ptr.contents)
-            callback(uav)
-
-        c_callback = UAVCallbackType(wrapper)
-        self._callbacks["timeout"] = c_callback
+        c_callback = self._make_trampoline(callback)
         self._lib.orip_set_on_uav_timeout(self._handle, c_callback, None)
+        self._cb_timeout = c_callback
 
     @staticmethod
     def version() -> str:
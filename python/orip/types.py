@@ -1,13 +1,39 @@
 """
 Data types for ORIP library.
+
+On Python 3.10+ the dataclasses are generated with ``__slots__`` to avoid a
+per-instance ``__dict__``; subclasses must declare their own ``__slots__`` to
+keep that benefit. ParseResult is frozen so that failure results, which carry
+no UAV, can safely be shared between callers; every successful result has its
+own UAVObject.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Optional
+from typing import Optional, Protocol
+
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _CodeEnum(IntEnum):
+    """IntEnum for wire/library codes, with a non-raising lookup."""
+
+    @classmethod
+    def from_int(cls, value: int):
+        """
+        Look up the member for an integer code.
 
+        Unlike ``cls(value)`` this is a single dict lookup and never raises;
+        unknown codes map to the zero-valued member (UNKNOWN/NONE/UNDECLARED).
+        """
+        members = cls._value2member_map_
+        return members.get(value, members[0])
 
-class ProtocolType(IntEnum):
+
+class ProtocolType(_CodeEnum):
     """Protocol types supported by the parser."""
     UNKNOWN = 0
     ASTM_F3411 = 1
@@ -15,7 +41,7 @@ class ProtocolType(IntEnum):
     CN_RID = 3
 
 
-class TransportType(IntEnum):
+class TransportType(_CodeEnum):
     """Transport layer type."""
     UNKNOWN = 0
     BT_LEGACY = 1
@@ -24,7 +50,7 @@ class TransportType(IntEnum):
     WIFI_NAN = 4
 
 
-class UAVIdType(IntEnum):
+class UAVIdType(_CodeEnum):
     """UAV identification type."""
     NONE = 0
     SERIAL_NUMBER = 1
@@ -33,7 +59,7 @@ class UAVIdType(IntEnum):
     SPECIFIC_SESSION = 4
 
 
-class UAVType(IntEnum):
+class UAVType(_CodeEnum):
     """UAV type classification."""
     NONE = 0
     AEROPLANE = 1
@@ -53,7 +79,7 @@ class UAVType(IntEnum):
     OTHER = 15
 
 
-class UAVStatus(IntEnum):
+class UAVStatus(_CodeEnum):
     """UAV status."""
     UNDECLARED = 0
     GROUND = 1
@@ -62,7 +88,14 @@ class UAVStatus(IntEnum):
     REMOTE_ID_FAILURE = 4
 
 
-@dataclass
+class UAVEventType(_CodeEnum):
+    """Kind of event reported by RemoteIDParser.drain_events()."""
+    NEW_UAV = 0
+    UAV_UPDATE = 1
+    UAV_TIMEOUT = 2
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LocationData:
     """Location and vector data for a UAV."""
     valid: bool = False
@@ -77,7 +110,7 @@ class LocationData:
     status: UAVStatus = UAVStatus.UNDECLARED
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemInfo:
     """System information (operator/pilot location)."""
     valid: bool = False
@@ -90,7 +123,7 @@ class SystemInfo:
     timestamp: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class UAVObject:
     """Complete UAV object containing all parsed data."""
     id: str = ""
@@ -107,7 +140,45 @@ class UAVObject:
     message_count: int = 0
 
 
-@dataclass
+class UAVView(Protocol):
+    """
+    UAV passed to parser callbacks.
+
+    Has the same attributes as UAVObject, converted from the library's
+    struct on first access. Repeated reads of location and system return
+    the same objects, so copy them before modifying. Call materialize()
+    for a UAVObject snapshot.
+    """
+
+    @property
+    def id(self) -> str: ...
+    @property
+    def id_type(self) -> UAVIdType: ...
+    @property
+    def uav_type(self) -> UAVType: ...
+    @property
+    def protocol(self) -> ProtocolType: ...
+    @property
+    def transport(self) -> TransportType: ...
+    @property
+    def rssi(self) -> int: ...
+    @property
+    def last_seen_ms(self) -> int: ...
+    @property
+    def location(self) -> LocationData: ...
+    @property
+    def system(self) -> SystemInfo: ...
+    @property
+    def self_id_description(self) -> Optional[str]: ...
+    @property
+    def operator_id(self) -> Optional[str]: ...
+    @property
+    def message_count(self) -> int: ...
+
+    def materialize(self) -> UAVObject: ...
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class ParseResult:
     """Parse result returned by the parser."""
     success: bool = False
@@ -117,7 +188,14 @@ class ParseResult:
     uav: Optional[UAVObject] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class UAVEvent:
+    """A queued new/update/timeout event with a snapshot of the UAV."""
+    type: UAVEventType
+    uav: UAVObject
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ParserConfig:
     """Parser configuration."""
     uav_timeout_ms: int = 30000
@@ -125,3 +203,7 @@ class ParserConfig:
     enable_astm: bool = True
     enable_asd: bool = False
     enable_cn: bool = False
+    # Skip decoding repeated identical payloads; results are fresh copies
+    enable_python_dedup: bool = False
+    # Queue new/update/timeout events for RemoteIDParser.drain_events()
+    enable_event_queue: bool = False
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for the ORIP Python tests.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+from orip import RemoteIDParser
+
+_cache_home = None
+
+
+def pytest_configure(config):
+    """Keep the library path cache out of the developer's ~/.cache."""
+    global _cache_home
+    _cache_home = tempfile.mkdtemp(prefix="orip-test-cache-")
+    os.environ["XDG_CACHE_HOME"] = _cache_home
+
+
+def pytest_unconfigure(config):
+    if _cache_home:
+        shutil.rmtree(_cache_home, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def parser_pool():
+    """Default-config parsers reused across the tests of a module."""
+    pool = []
+    yield pool
+    for parser in pool:
+        parser.close()
+
+
+@pytest.fixture
+def parser(parser_pool):
+    """A default-config parser from the pool, returned to it in a clean state."""
+    parser = parser_pool.pop() if parser_pool else RemoteIDParser()
+    try:
+        yield parser
+    finally:
+        parser.set_on_new_uav(None)
+        parser.set_on_uav_update(None)
+        parser.set_on_uav_timeout(None)
+        parser.set_event_queue(False)  # Also discards undrained events
+        parser.drain_events()
+        parser.clear()
+        parser_pool.append(parser)
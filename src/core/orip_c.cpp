@@ -1,7 +1,10 @@
 #include "orip/orip_c.h"
 #include "orip/orip.h"
+#include <algorithm>
 #include <cstring>
 #include <chrono>
+#include <deque>
+#include <mutex>
 
 /* ============================================================================
  * Internal wrapper structure
@@ -16,14 +19,29 @@ struct orip_parser_t {
     void* update_user_data;
     void* timeout_user_data;
 
+    // Event queue (orip_set_event_queue); guarded so it can be drained
+    // from another thread while this one parses
+    bool queue_events;
+    mutable std::mutex event_mutex;
+    std::deque<orip_event_t> events;
+
+    // Whether each hook is currently installed on the C++ parser
+    bool new_uav_hooked;
+    bool update_hooked;
+    bool timeout_hooked;
+
     orip_parser_t() : on_new_uav(nullptr), on_uav_update(nullptr),
                       on_uav_timeout(nullptr), new_uav_user_data(nullptr),
-                      update_user_data(nullptr), timeout_user_data(nullptr) {}
+                      update_user_data(nullptr), timeout_user_data(nullptr),
+                      queue_events(false), new_uav_hooked(false),
+                      update_hooked(false), timeout_hooked(false) {}
 
     explicit orip_parser_t(const orip::ParserConfig& config)
         : parser(config), on_new_uav(nullptr), on_uav_update(nullptr),
           on_uav_timeout(nullptr), new_uav_user_data(nullptr),
-          update_user_data(nullptr), timeout_user_data(nullptr) {}
+          update_user_data(nullptr), timeout_user_data(nullptr),
+          queue_events(false), new_uav_hooked(false),
+          update_hooked(false), timeout_hooked(false) {}
 };
 
 /* ============================================================================
@@ -102,6 +120,82 @@ static orip::ParserConfig convert_config_from_c(const orip_config_t* config) {
     return cfg;
 }
 
+/*
+ * Forward a C++ parser event to the event queue and/or the C callback.
+ * The callback and user data are read at call time, so swapping a
+ * callback does not need to reinstall the hook.
+ */
+static void dispatch_event(orip_parser_t* parser, orip_event_type_t type,
+                           orip_uav_callback_t callback, void* user_data,
+                           const orip::UAVObject& uav) {
+    orip_event_t event;
+    event.type = type;
+    convert_uav_to_c(uav, &event.uav);
+
+    if (parser->queue_events) {
+        std::lock_guard<std::mutex> lock(parser->event_mutex);
+        parser->events.push_back(event);
+    }
+    if (callback) {
+        callback(&event.uav, user_data);
+    }
+}
+
+// Hooks read the callback pointers when they fire, so a hook is only
+// installed or removed when it switches between needed and unneeded. A
+// callback can therefore swap callbacks or toggle the event queue while it
+// runs without its own hook being reassigned underneath it
+static void install_new_uav_hook(orip_parser_t* parser) {
+    bool needed = parser->on_new_uav || parser->queue_events;
+    if (needed == parser->new_uav_hooked) {
+        return;
+    }
+    parser->new_uav_hooked = needed;
+
+    if (needed) {
+        parser->parser.setOnNewUAV([parser](const orip::UAVObject& uav) {
+            dispatch_event(parser, ORIP_EVENT_NEW_UAV, parser->on_new_uav,
+                           parser->new_uav_user_data, uav);
+        });
+    } else {
+        parser->parser.setOnNewUAV(nullptr);
+    }
+}
+
+static void install_update_hook(orip_parser_t* parser) {
+    bool needed = parser->on_uav_update || parser->queue_events;
+    if (needed == parser->update_hooked) {
+        return;
+    }
+    parser->update_hooked = needed;
+
+    if (needed) {
+        parser->parser.setOnUAVUpdate([parser](const orip::UAVObject& uav) {
+            dispatch_event(parser, ORIP_EVENT_UAV_UPDATE, parser->on_uav_update,
+                           parser->update_user_data, uav);
+        });
+    } else {
+        parser->parser.setOnUAVUpdate(nullptr);
+    }
+}
+
+static void install_timeout_hook(orip_parser_t* parser) {
+    bool needed = parser->on_uav_timeout || parser->queue_events;
+    if (needed == parser->timeout_hooked) {
+        return;
+    }
+    parser->timeout_hooked = needed;
+
+    if (needed) {
+        parser->parser.setOnUAVTimeout([parser](const orip::UAVObject& uav) {
+            dispatch_event(parser, ORIP_EVENT_UAV_TIMEOUT, parser->on_uav_timeout,
+                           parser->timeout_user_data, uav);
+        });
+    } else {
+        parser->parser.setOnUAVTimeout(nullptr);
+    }
+}
+
 /* ============================================================================
  * Library functions implementation
  * ============================================================================ */
@@ -188,6 +282,35 @@ int orip_parse(orip_parser_t* parser,
     }
 }
 
+int orip_parse_batch(orip_parser_t* parser,
+                     const uint8_t* const* payloads,
+                     const size_t* payload_lens,
+                     const int8_t* rssis,
+                     const orip_transport_t* transports,
+                     size_t count,
+                     orip_result_t* results) {
+    if (!parser || !payloads || !payload_lens || !rssis || !transports || !results) {
+        return -1;
+    }
+
+    int ret = 0;
+    for (size_t i = 0; i < count; i++) {
+        if (!payloads[i]) {
+            std::memset(&results[i], 0, sizeof(orip_result_t));
+            std::strncpy(results[i].error, "Invalid payload", sizeof(results[i].error) - 1);
+            ret = -1;
+            continue;
+        }
+
+        if (orip_parse(parser, payloads[i], payload_lens[i], rssis[i],
+                       transports[i], &results[i]) != 0) {
+            ret = -1;
+        }
+    }
+
+    return ret;
+}
+
 size_t orip_get_active_count(const orip_parser_t* parser) {
     if (!parser) {
         return 0;
@@ -232,6 +355,28 @@ int orip_get_uav(const orip_parser_t* parser,
     return 0;
 }
 
+int orip_touch(orip_parser_t* parser,
+               const char* id,
+               int8_t rssi,
+               orip_uav_t* uav) {
+    if (!parser || !id) {
+        return -1;
+    }
+
+    if (!parser->parser.touch(id, rssi)) {
+        return -1;
+    }
+
+    if (uav) {
+        const orip::UAVObject* found = parser->parser.getUAV(id);
+        if (found) {
+            convert_uav_to_c(*found, uav);
+        }
+    }
+
+    return 0;
+}
+
 void orip_clear(orip_parser_t* parser) {
     if (parser) {
         parser->parser.clear();
@@ -259,16 +404,7 @@ void orip_set_on_new_uav(orip_parser_t* parser,
 
     parser->on_new_uav = callback;
     parser->new_uav_user_data = user_data;
-
-    if (callback) {
-        parser->parser.setOnNewUAV([parser](const orip::UAVObject& uav) {
-            orip_uav_t c_uav;
-            convert_uav_to_c(uav, &c_uav);
-            parser->on_new_uav(&c_uav, parser->new_uav_user_data);
-        });
-    } else {
-        parser->parser.setOnNewUAV(nullptr);
-    }
+    install_new_uav_hook(parser);
 }
 
 void orip_set_on_uav_update(orip_parser_t* parser,
@@ -280,16 +416,7 @@ void orip_set_on_uav_update(orip_parser_t* parser,
 
     parser->on_uav_update = callback;
     parser->update_user_data = user_data;
-
-    if (callback) {
-        parser->parser.setOnUAVUpdate([parser](const orip::UAVObject& uav) {
-            orip_uav_t c_uav;
-            convert_uav_to_c(uav, &c_uav);
-            parser->on_uav_update(&c_uav, parser->update_user_data);
-        });
-    } else {
-        parser->parser.setOnUAVUpdate(nullptr);
-    }
+    install_update_hook(parser);
 }
 
 void orip_set_on_uav_timeout(orip_parser_t* parser,
@@ -301,16 +428,47 @@ void orip_set_on_uav_timeout(orip_parser_t* parser,
 
     parser->on_uav_timeout = callback;
     parser->timeout_user_data = user_data;
+    install_timeout_hook(parser);
+}
 
-    if (callback) {
-        parser->parser.setOnUAVTimeout([parser](const orip::UAVObject& uav) {
-            orip_uav_t c_uav;
-            convert_uav_to_c(uav, &c_uav);
-            parser->on_uav_timeout(&c_uav, parser->timeout_user_data);
-        });
-    } else {
-        parser->parser.setOnUAVTimeout(nullptr);
+void orip_set_event_queue(orip_parser_t* parser, int enabled) {
+    if (!parser) {
+        return;
+    }
+
+    parser->queue_events = enabled != 0;
+    if (!parser->queue_events) {
+        std::lock_guard<std::mutex> lock(parser->event_mutex);
+        parser->events.clear();
+    }
+
+    install_new_uav_hook(parser);
+    install_update_hook(parser);
+    install_timeout_hook(parser);
+}
+
+size_t orip_pending_events(const orip_parser_t* parser) {
+    if (!parser) {
+        return 0;
+    }
+
+    std::lock_guard<std::mutex> lock(parser->event_mutex);
+    return parser->events.size();
+}
+
+size_t orip_drain_events(orip_parser_t* parser,
+                         orip_event_t* events,
+                         size_t max_count) {
+    if (!parser || !events) {
+        return 0;
     }
+
+    std::lock_guard<std::mutex> lock(parser->event_mutex);
+    size_t count = std::min(max_count, parser->events.size());
+    std::copy(parser->events.begin(), parser->events.begin() + count, events);
+    parser->events.erase(parser->events.begin(), parser->events.begin() + count);
+
+    return count;
 }
 
 } /* extern "C" */
@@ -190,7 +190,7 @@ std::vector<UAVObject> RemoteIDParser::getActiveUAVs() const {
     return impl_->session_manager.getActiveUAVs();
 }
 
-const UAVObject* RemoteIDParser::getUAV(const std::string& id) const {
+const UAVObject* RemoteIDParser::getUAV(std::string_view id) const {
     return impl_->session_manager.getUAV(id);
 }
 
@@ -198,6 +198,10 @@ size_t RemoteIDParser::getActiveCount() const {
     return impl_->session_manager.count();
 }
 
+bool RemoteIDParser::touch(std::string_view id, int8_t rssi) {
+    return impl_->session_manager.touch(id, rssi);
+}
+
 void RemoteIDParser::clear() {
     impl_->session_manager.clear();
 }
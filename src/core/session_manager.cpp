@@ -1,27 +1,72 @@
 #include "orip/session_manager.h"
 #include <algorithm>
+#include <cstring>
 
 namespace orip {
 
 SessionManager::SessionManager(uint32_t timeout_ms)
     : timeout_(timeout_ms) {}
 
+bool SessionManager::makeKey(std::string_view id, IDKey& key) {
+    if (id.size() > MAX_TRACKED_ID_LENGTH) {
+        return false;
+    }
+    key = IDKey{};
+    std::memcpy(key.bytes.data(), id.data(), id.size());
+    key.length = static_cast<uint8_t>(id.size());
+    return true;
+}
+
+UAVObject* SessionManager::find(std::string_view id) {
+    IDKey key;
+    if (!makeKey(id, key)) {
+        return nullptr;
+    }
+    auto it = index_.find(key);
+    return (it != index_.end()) ? &uavs_[it->second] : nullptr;
+}
+
+const UAVObject* SessionManager::find(std::string_view id) const {
+    IDKey key;
+    if (!makeKey(id, key)) {
+        return nullptr;
+    }
+    auto it = index_.find(key);
+    return (it != index_.end()) ? &uavs_[it->second] : nullptr;
+}
+
+void SessionManager::removeAt(size_t pos) {
+    IDKey key;
+    makeKey(uavs_[pos].id, key);
+    index_.erase(key);
+
+    size_t last = uavs_.size() - 1;
+    if (pos != last) {
+        uavs_[pos] = std::move(uavs_[last]);
+        makeKey(uavs_[pos].id, key);
+        index_[key] = pos;
+    }
+    uavs_.pop_back();
+}
+
 bool SessionManager::update(const UAVObject& uav) {
-    if (uav.id.empty()) {
+    IDKey key;
+    if (uav.id.empty() || !makeKey(uav.id, key)) {
         return false;
     }
 
-    auto it = uavs_.find(uav.id);
-    bool is_new = (it == uavs_.end());
+    auto it = index_.find(key);
+    bool is_new = (it == index_.end());
 
     if (is_new) {
-        uavs_[uav.id] = uav;
+        index_.emplace(key, uavs_.size());
+        uavs_.push_back(uav);
         if (on_new_uav_) {
             on_new_uav_(uav);
         }
     } else {
         // Merge new data into existing UAV
-        UAVObject& existing = it->second;
+        UAVObject& existing = uavs_[it->second];
 
         // Update signal info
         existing.rssi = uav.rssi;
@@ -62,12 +107,7 @@ bool SessionManager::update(const UAVObject& uav) {
 }
 
 std::vector<UAVObject> SessionManager::getActiveUAVs() const {
-    std::vector<UAVObject> result;
-    result.reserve(uavs_.size());
-
-    for (const auto& pair : uavs_) {
-        result.push_back(pair.second);
-    }
+    std::vector<UAVObject> result(uavs_);
 
     // Sort by last seen (most recent first)
     std::sort(result.begin(), result.end(),
@@ -78,31 +118,46 @@ std::vector<UAVObject> SessionManager::getActiveUAVs() const {
     return result;
 }
 
-const UAVObject* SessionManager::getUAV(const std::string& id) const {
-    auto it = uavs_.find(id);
-    return (it != uavs_.end()) ? &it->second : nullptr;
+const UAVObject* SessionManager::getUAV(std::string_view id) const {
+    return find(id);
 }
 
 size_t SessionManager::count() const {
     return uavs_.size();
 }
 
+bool SessionManager::touch(std::string_view id, int8_t rssi) {
+    UAVObject* existing = find(id);
+    if (!existing) {
+        return false;
+    }
+
+    existing->rssi = rssi;
+    existing->last_seen = std::chrono::steady_clock::now();
+    existing->message_count++;
+
+    if (on_uav_update_) {
+        on_uav_update_(*existing);
+    }
+
+    return true;
+}
+
 std::vector<std::string> SessionManager::cleanup() {
     std::vector<std::string> removed;
     auto now = std::chrono::steady_clock::now();
 
-    for (auto it = uavs_.begin(); it != uavs_.end(); ) {
+    // Walk backwards so removeAt only moves UAVs that were already checked
+    for (size_t i = uavs_.size(); i-- > 0; ) {
         auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(
-            now - it->second.last_seen);
+            now - uavs_[i].last_seen);
 
         if (elapsed > timeout_) {
             if (on_uav_timeout_) {
-                on_uav_timeout_(it->second);
+                on_uav_timeout_(uavs_[i]);
             }
-            removed.push_back(it->first);
-            it = uavs_.erase(it);
-        } else {
-            ++it;
+            removed.push_back(uavs_[i].id);
+            removeAt(i);
         }
     }
 
@@ -111,6 +166,7 @@ std::vector<std::string> SessionManager::cleanup() {
 
 void SessionManager::clear() {
     uavs_.clear();
+    index_.clear();
 }
 
 void SessionManager::setOnNewUAV(UAVCallback callback) {
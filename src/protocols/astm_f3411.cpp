@@ -21,11 +21,79 @@ constexpr float DIRECTION_MULTIPLIER = 1.0f;  // degrees
 constexpr uint8_t EXT_ADV_LEGACY_PDU = 0x10;     // Legacy PDU flag
 constexpr size_t EXT_ADV_MIN_HEADER = 2;         // Minimum extended header
 
+namespace {
+
+// Load 4 bytes in host byte order
+uint32_t load32(const uint8_t* p) {
+    uint32_t word;
+    std::memcpy(&word, p, sizeof(word));
+    return word;
+}
+
+// [len][0x16][0xFA][0xFF] as one word; the length byte is masked out.
+// Built through load32 so the constants match on any endianness.
+constexpr uint8_t ODID_HEADER_BYTES[4] = {
+    0x00, ODID_AD_TYPE, ODID_SERVICE_UUID & 0xFF, ODID_SERVICE_UUID >> 8
+};
+constexpr uint8_t ODID_HEADER_MASK_BYTES[4] = {0x00, 0xFF, 0xFF, 0xFF};
+const uint32_t ODID_HEADER = load32(ODID_HEADER_BYTES);
+const uint32_t ODID_HEADER_MASK = load32(ODID_HEADER_MASK_BYTES);
+
+// Canonical ODID advertisement: the first AD structure is the ODID Service
+// Data. Checked in O(1), with a single 32-bit compare, before any scanning.
+bool startsWithODIDServiceData(const std::vector<uint8_t>& payload) {
+    return payload.size() >= 5 &&
+           (load32(payload.data()) & ODID_HEADER_MASK) == ODID_HEADER &&
+           payload[0] >= 4 && payload[0] < payload.size();
+}
+
+// 4-bit wire codes -> enums, one indexed load per field. Codes reserved by
+// ASTM F3411 map to NONE/UNDECLARED so decoded enums are always valid.
+constexpr UAVIdType ID_TYPE_TABLE[16] = {
+    UAVIdType::NONE,
+    UAVIdType::SERIAL_NUMBER,
+    UAVIdType::CAA_REGISTRATION,
+    UAVIdType::UTM_ASSIGNED,
+    UAVIdType::SPECIFIC_SESSION,
+    UAVIdType::NONE, UAVIdType::NONE, UAVIdType::NONE, UAVIdType::NONE,
+    UAVIdType::NONE, UAVIdType::NONE, UAVIdType::NONE, UAVIdType::NONE,
+    UAVIdType::NONE, UAVIdType::NONE, UAVIdType::NONE,
+};
+
+constexpr UAVStatus STATUS_TABLE[16] = {
+    UAVStatus::UNDECLARED,
+    UAVStatus::GROUND,
+    UAVStatus::AIRBORNE,
+    UAVStatus::EMERGENCY,
+    UAVStatus::REMOTE_ID_FAILURE,
+    UAVStatus::UNDECLARED, UAVStatus::UNDECLARED, UAVStatus::UNDECLARED,
+    UAVStatus::UNDECLARED, UAVStatus::UNDECLARED, UAVStatus::UNDECLARED,
+    UAVStatus::UNDECLARED, UAVStatus::UNDECLARED, UAVStatus::UNDECLARED,
+    UAVStatus::UNDECLARED, UAVStatus::UNDECLARED,
+};
+
+// Basic ID message (type 0x0) wire layout. Every field is byte-sized, so
+// the struct has no padding and is filled from the message with one memcpy.
+struct BasicIDMessage {
+    uint8_t header;                 // Message type | protocol version
+    uint8_t id_and_ua_type;         // ID type (high nibble) | UA type (low nibble)
+    char uas_id[BASIC_ID_LENGTH];   // NUL- or space-padded
+    uint8_t reserved[3];
+};
+static_assert(sizeof(BasicIDMessage) == MESSAGE_SIZE,
+              "BasicIDMessage must match the 25-byte wire format");
+
+}  // namespace
+
 bool ASTM_F3411_Decoder::isRemoteID(const std::vector<uint8_t>& payload) const {
     if (payload.size() < 5) {
         return false;
     }
 
+    if (startsWithODIDServiceData(payload)) {
+        return true;
+    }
+
     // Check for extended advertising first
     if (isExtendedAdvertising(payload)) {
         return true;
@@ -58,18 +126,23 @@ bool ASTM_F3411_Decoder::isExtendedAdvertising(const std::vector<uint8_t>& paylo
     }
 
     // Extended advertising can have different structures
-    // Look for ODID UUID anywhere in the extended payload
-    for (size_t i = 0; i + 4 < payload.size(); i++) {
+    // Look for ODID UUID anywhere in the extended payload; memchr skips
+    // straight to candidate AD type bytes, so garbage is rejected quickly
+    const uint8_t* p = payload.data();
+    const uint8_t* const end = p + payload.size() - 4;
+    while (p < end) {
+        p = static_cast<const uint8_t*>(std::memchr(p, ODID_AD_TYPE, end - p));
+        if (!p) {
+            break;
+        }
+
         // Check for Service Data AD Type with ODID UUID
-        if (payload[i] == ODID_AD_TYPE) {
-            if (i + 3 < payload.size()) {
-                uint16_t uuid = static_cast<uint16_t>(payload[i + 1]) |
-                               (static_cast<uint16_t>(payload[i + 2]) << 8);
-                if (uuid == ODID_SERVICE_UUID) {
-                    return true;
-                }
-            }
+        uint16_t uuid = static_cast<uint16_t>(p[1]) |
+                       (static_cast<uint16_t>(p[2]) << 8);
+        if (uuid == ODID_SERVICE_UUID) {
+            return true;
         }
+        p++;
     }
 
     return false;
@@ -260,17 +333,19 @@ DecodeResult ASTM_F3411_Decoder::decodeMessage(const uint8_t* data, size_t len,
 }
 
 bool ASTM_F3411_Decoder::decodeBasicID(const uint8_t* data, UAVObject& uav) {
-    uint8_t type_byte = data[1];
-    uav.id_type = static_cast<UAVIdType>((type_byte >> 4) & 0x0F);
-    uav.uav_type = static_cast<UAVType>(type_byte & 0x0F);
+    BasicIDMessage msg;
+    std::memcpy(&msg, data, sizeof(msg));
 
-    char id_buf[BASIC_ID_LENGTH + 1] = {0};
-    std::memcpy(id_buf, data + 2, BASIC_ID_LENGTH);
-    uav.id = std::string(id_buf);
+    uav.id_type = ID_TYPE_TABLE[(msg.id_and_ua_type >> 4) & 0x0F];
+    uav.uav_type = static_cast<UAVType>(msg.id_and_ua_type & 0x0F);  // All 16 codes defined
 
-    while (!uav.id.empty() && (uav.id.back() == ' ' || uav.id.back() == '\0')) {
-        uav.id.pop_back();
+    // The ID ends at the first NUL (none if all 20 bytes are used),
+    // without trailing space padding
+    const char* id_end = std::find(msg.uas_id, msg.uas_id + BASIC_ID_LENGTH, '\0');
+    while (id_end != msg.uas_id && id_end[-1] == ' ') {
+        --id_end;
     }
+    uav.id.assign(msg.uas_id, static_cast<size_t>(id_end - msg.uas_id));
 
     return true;
 }
@@ -280,7 +355,7 @@ bool ASTM_F3411_Decoder::decodeLocation(const uint8_t* data, UAVObject& uav) {
     loc.valid = true;
 
     uint8_t status_byte = data[1];
-    loc.status = static_cast<UAVStatus>((status_byte >> 4) & 0x0F);
+    loc.status = STATUS_TABLE[(status_byte >> 4) & 0x0F];
     loc.height_ref = static_cast<HeightReference>((status_byte >> 2) & 0x01);
     bool speed_mult = (status_byte & 0x01) != 0;
 
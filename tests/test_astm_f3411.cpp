@@ -1,6 +1,7 @@
 #include <gtest/gtest.h>
 #include "orip/astm_f3411.h"
 #include "orip/parser.h"
+#include "orip/session_manager.h"
 #include <cmath>
 
 using namespace orip;
@@ -118,6 +119,23 @@ TEST_F(ASTM_F3411_Test, IsRemoteID_WrongUUID) {
     EXPECT_FALSE(decoder.isRemoteID(wrong_uuid));
 }
 
+TEST_F(ASTM_F3411_Test, IsRemoteID_ODIDAfterOtherADStructure) {
+    // Flags AD structure before the ODID Service Data
+    std::vector<uint8_t> adv = {0x02, 0x01, 0x06};
+    auto odid = createBLEAdvertisement(createBasicIDMessage("AFTER_FLAGS"));
+    adv.insert(adv.end(), odid.begin(), odid.end());
+
+    EXPECT_TRUE(decoder.isRemoteID(adv));
+}
+
+TEST_F(ASTM_F3411_Test, IsRemoteID_LargeGarbage) {
+    std::vector<uint8_t> zeros(1024 * 1024, 0x00);
+    EXPECT_FALSE(decoder.isRemoteID(zeros));
+
+    std::vector<uint8_t> ad_types(4096, ODID_AD_TYPE);
+    EXPECT_FALSE(decoder.isRemoteID(ad_types));
+}
+
 TEST_F(ASTM_F3411_Test, DecodeBasicID) {
     std::string serial = "DJI1234567890ABC";
     auto msg = createBasicIDMessage(serial, UAVIdType::SERIAL_NUMBER,
@@ -134,6 +152,32 @@ TEST_F(ASTM_F3411_Test, DecodeBasicID) {
     EXPECT_EQ(uav.uav_type, UAVType::HELICOPTER_OR_MULTIROTOR);
 }
 
+TEST_F(ASTM_F3411_Test, DecodeBasicID_IDPadding) {
+    UAVObject uav;
+
+    // All 20 bytes used: no terminator in the message
+    auto full = createBLEAdvertisement(createBasicIDMessage("ABCDEFGHIJ0123456789"));
+    ASSERT_TRUE(decoder.decode(full, uav).success);
+    EXPECT_EQ(uav.id, "ABCDEFGHIJ0123456789");
+
+    // Space padding is trimmed
+    auto spaced = createBLEAdvertisement(createBasicIDMessage("PADDED              "));
+    ASSERT_TRUE(decoder.decode(spaced, uav).success);
+    EXPECT_EQ(uav.id, "PADDED");
+}
+
+TEST_F(ASTM_F3411_Test, DecodeBasicID_ReservedIDType) {
+    auto msg = createBasicIDMessage("RESERVED", static_cast<UAVIdType>(7));
+    auto adv = createBLEAdvertisement(msg);
+
+    UAVObject uav;
+    auto result = decoder.decode(adv, uav);
+
+    EXPECT_TRUE(result.success);
+    EXPECT_EQ(uav.id_type, UAVIdType::NONE);
+    EXPECT_EQ(uav.uav_type, UAVType::HELICOPTER_OR_MULTIROTOR);
+}
+
 TEST_F(ASTM_F3411_Test, DecodeLocation) {
     double lat = 37.7749;
     double lon = -122.4194;
@@ -219,6 +263,75 @@ TEST_F(ASTM_F3411_Test, SessionManagerTracking) {
     EXPECT_EQ(uav1->rssi, -60);
 }
 
+TEST_F(ASTM_F3411_Test, SessionManagerTouch) {
+    RemoteIDParser parser;
+    parser.init();
+
+    auto msg = createBasicIDMessage("UAV001");
+    auto adv = createBLEAdvertisement(msg);
+    parser.parse(adv, -60, TransportType::BT_LEGACY);
+
+    auto* uav = parser.getUAV("UAV001");
+    ASSERT_NE(uav, nullptr);
+    uint32_t count_before = uav->message_count;
+
+    EXPECT_TRUE(parser.touch("UAV001", -58));
+    uav = parser.getUAV("UAV001");
+    ASSERT_NE(uav, nullptr);
+    EXPECT_EQ(uav->rssi, -58);
+    EXPECT_EQ(uav->message_count, count_before + 1);
+
+    EXPECT_FALSE(parser.touch("UAV002", -60));
+}
+
+TEST_F(ASTM_F3411_Test, SessionManagerCleanupKeepsIndex) {
+    SessionManager manager(1000);
+    auto now = std::chrono::steady_clock::now();
+    auto stale = now - std::chrono::seconds(5);
+
+    for (const char* id : {"STALE1", "FRESH", "STALE2", "FRESH2"}) {
+        UAVObject uav;
+        uav.id = id;
+        uav.last_seen = (id[0] == 'S') ? stale : now;
+        EXPECT_TRUE(manager.update(uav));
+    }
+
+    auto removed = manager.cleanup();
+    EXPECT_EQ(removed.size(), 2u);
+    EXPECT_EQ(manager.count(), 2u);
+    EXPECT_EQ(manager.getUAV("STALE1"), nullptr);
+    EXPECT_EQ(manager.getUAV("STALE2"), nullptr);
+
+    for (const char* id : {"FRESH", "FRESH2"}) {
+        const UAVObject* uav = manager.getUAV(id);
+        ASSERT_NE(uav, nullptr);
+        EXPECT_EQ(uav->id, id);
+    }
+
+    UAVObject added;
+    added.id = "ADDED";
+    added.last_seen = now;
+    EXPECT_TRUE(manager.update(added));
+    EXPECT_FALSE(manager.update(added));
+    EXPECT_EQ(manager.count(), 3u);
+    EXPECT_EQ(manager.getActiveUAVs().size(), 3u);
+}
+
+TEST_F(ASTM_F3411_Test, SessionManagerIDLengthLimit) {
+    SessionManager manager;
+
+    UAVObject longest;
+    longest.id = std::string(MAX_TRACKED_ID_LENGTH, 'A');
+    EXPECT_TRUE(manager.update(longest));
+    EXPECT_NE(manager.getUAV(longest.id), nullptr);
+
+    UAVObject too_long;
+    too_long.id = std::string(MAX_TRACKED_ID_LENGTH + 1, 'A');
+    EXPECT_FALSE(manager.update(too_long));
+    EXPECT_EQ(manager.getUAV(too_long.id), nullptr);
+    EXPECT_EQ(manager.count(), 1u);
+}
+
 // =============================================================================
 // Authentication Message Tests (Type 0x2)
 // =============================================================================
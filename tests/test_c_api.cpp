@@ -23,7 +23,7 @@ protected:
         std::vector<uint8_t> adv;
 
         // AD structure: [length][type 0x16][UUID low][UUID high][counter][message...]
-        adv.push_back(30);   // Length
+        adv.push_back(29);   // Length (AD type + UUID + counter + message)
         adv.push_back(0x16); // Service Data AD type
         adv.push_back(0xFA); // UUID low (0xFFFA)
         adv.push_back(0xFF); // UUID high
@@ -116,6 +116,64 @@ TEST_F(CAPITest, ParseNullParams) {
     EXPECT_EQ(orip_parse(parser, data, 1, 0, ORIP_TRANSPORT_BT_LEGACY, nullptr), -1);
 }
 
+TEST_F(CAPITest, ParseBatch) {
+    auto adv1 = createBasicIDAdvertisement("BATCH01");
+    auto adv2 = createBasicIDAdvertisement("BATCH02");
+    uint8_t invalid[] = {0x01, 0x02, 0x03};
+
+    const uint8_t* payloads[] = {adv1.data(), invalid, adv2.data()};
+    size_t lens[] = {adv1.size(), sizeof(invalid), adv2.size()};
+    int8_t rssis[] = {-60, -50, -70};
+    orip_transport_t transports[] = {ORIP_TRANSPORT_BT_LEGACY, ORIP_TRANSPORT_BT_LEGACY,
+                                      ORIP_TRANSPORT_BT_LEGACY};
+    orip_result_t results[3];
+
+    EXPECT_EQ(orip_parse_batch(parser, payloads, lens, rssis, transports, 3, results), 0);
+
+    EXPECT_EQ(results[0].success, 1);
+    EXPECT_EQ(results[0].is_remote_id, 1);
+    EXPECT_STREQ(results[0].uav.id, "BATCH01");
+    EXPECT_EQ(results[0].uav.rssi, -60);
+
+    EXPECT_EQ(results[1].success, 0);
+    EXPECT_EQ(results[1].is_remote_id, 0);
+
+    EXPECT_EQ(results[2].success, 1);
+    EXPECT_EQ(results[2].is_remote_id, 1);
+    EXPECT_STREQ(results[2].uav.id, "BATCH02");
+    EXPECT_EQ(results[2].uav.rssi, -70);
+
+    // Batch results must match individual parse calls
+    orip_parser_t* single = orip_create();
+    for (size_t i = 0; i < 3; i++) {
+        orip_result_t expected;
+        orip_parse(single, payloads[i], lens[i], rssis[i], transports[i], &expected);
+        EXPECT_EQ(results[i].success, expected.success);
+        EXPECT_EQ(results[i].is_remote_id, expected.is_remote_id);
+        EXPECT_STREQ(results[i].uav.id, expected.uav.id);
+    }
+    orip_destroy(single);
+    EXPECT_EQ(orip_get_active_count(parser), 2u);
+}
+
+TEST_F(CAPITest, ParseBatchNullParams) {
+    uint8_t data[] = {0x01};
+    const uint8_t* payloads[] = {data, nullptr};
+    size_t lens[] = {1, 1};
+    int8_t rssis[] = {0, 0};
+    orip_transport_t transports[] = {ORIP_TRANSPORT_BT_LEGACY, ORIP_TRANSPORT_BT_LEGACY};
+    orip_result_t results[2];
+
+    EXPECT_EQ(orip_parse_batch(nullptr, payloads, lens, rssis, transports, 1, results), -1);
+    EXPECT_EQ(orip_parse_batch(parser, payloads, lens, rssis, transports, 1, nullptr), -1);
+    EXPECT_EQ(orip_parse_batch(parser, payloads, lens, rssis, transports, 0, results), 0);
+
+    // A null entry fails only its own slot
+    EXPECT_EQ(orip_parse_batch(parser, payloads, lens, rssis, transports, 2, results), -1);
+    EXPECT_EQ(results[1].success, 0);
+    EXPECT_STREQ(results[1].error, "Invalid payload");
+}
+
 TEST_F(CAPITest, ActiveUAVCount) {
     EXPECT_EQ(orip_get_active_count(parser), 0u);
 
@@ -171,6 +229,12 @@ TEST_F(CAPITest, GetUAVByID) {
     EXPECT_NE(ret, 0);
 }
 
+TEST_F(CAPITest, TouchUnknown) {
+    EXPECT_NE(orip_touch(parser, "NOTEXIST", -60, nullptr), 0);
+    EXPECT_NE(orip_touch(nullptr, "NOTEXIST", -60, nullptr), 0);
+    EXPECT_NE(orip_touch(parser, nullptr, -60, nullptr), 0);
+}
+
 TEST_F(CAPITest, Clear) {
     auto adv = createBasicIDAdvertisement("TEMP");
 
@@ -212,3 +276,71 @@ TEST_F(CAPITest, Callbacks) {
     // Clear callback
     orip_set_on_new_uav(parser, nullptr, nullptr);
 }
+
+TEST_F(CAPITest, EventQueueNullParams) {
+    orip_event_t event;
+
+    orip_set_event_queue(nullptr, 1);
+    EXPECT_EQ(orip_pending_events(nullptr), 0u);
+    EXPECT_EQ(orip_drain_events(nullptr, &event, 1), 0u);
+    EXPECT_EQ(orip_drain_events(parser, nullptr, 1), 0u);
+}
+
+TEST_F(CAPITest, EventQueueEmpty) {
+    orip_event_t events[4];
+
+    orip_set_event_queue(parser, 1);
+    EXPECT_EQ(orip_pending_events(parser), 0u);
+    EXPECT_EQ(orip_drain_events(parser, events, 4), 0u);
+
+    orip_set_event_queue(parser, 0);
+    EXPECT_EQ(orip_pending_events(parser), 0u);
+}
+
+TEST_F(CAPITest, EventQueueDrain) {
+    orip_set_event_queue(parser, 1);
+
+    auto adv = createBasicIDAdvertisement("QUEUE_TEST");
+    orip_result_t result;
+    orip_parse(parser, adv.data(), adv.size(), -60, ORIP_TRANSPORT_BT_LEGACY, &result);
+    ASSERT_EQ(result.success, 1);
+    orip_parse(parser, adv.data(), adv.size(), -55, ORIP_TRANSPORT_BT_LEGACY, &result);
+    ASSERT_EQ(result.success, 1);
+
+    ASSERT_EQ(orip_pending_events(parser), 2u);
+
+    orip_event_t events[4];
+    ASSERT_EQ(orip_drain_events(parser, events, 4), 2u);
+    EXPECT_EQ(events[0].type, ORIP_EVENT_NEW_UAV);
+    EXPECT_STREQ(events[0].uav.id, "QUEUE_TEST");
+    EXPECT_EQ(events[0].uav.rssi, -60);
+    EXPECT_EQ(events[1].type, ORIP_EVENT_UAV_UPDATE);
+    EXPECT_STREQ(events[1].uav.id, "QUEUE_TEST");
+    EXPECT_EQ(events[1].uav.rssi, -55);
+    EXPECT_EQ(orip_pending_events(parser), 0u);
+
+    orip_set_event_queue(parser, 0);
+}
+
+TEST_F(CAPITest, TouchFiresUpdate) {
+    auto adv = createBasicIDAdvertisement("TOUCH_TEST");
+    orip_result_t result;
+    orip_parse(parser, adv.data(), adv.size(), -60, ORIP_TRANSPORT_BT_LEGACY, &result);
+    ASSERT_EQ(result.success, 1);
+
+    g_callback_count = 0;
+    orip_set_on_uav_update(parser, test_callback, nullptr);
+
+    orip_uav_t uav;
+    EXPECT_EQ(orip_touch(parser, "TOUCH_TEST", -55, &uav), 0);
+    EXPECT_EQ(g_callback_count, 1);
+    EXPECT_STREQ(uav.id, "TOUCH_TEST");
+    EXPECT_EQ(uav.rssi, -55);
+    EXPECT_EQ(uav.message_count, 2u);
+
+    // The output struct is optional
+    EXPECT_EQ(orip_touch(parser, "TOUCH_TEST", -50, nullptr), 0);
+    EXPECT_EQ(g_callback_count, 2);
+
+    orip_set_on_uav_update(parser, nullptr, nullptr);
+}